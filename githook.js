@@ -39,6 +39,48 @@ var name_transforms = [
 
 ];
 
+function process_ref(remote, name, value, trigger) {
+  name_transforms.forEach(function (transform) {
+    name = name.replace(transform.regexp, transform.replacement);
+  });
+
+  var tracked_branch = critic.TrackedBranch.find({
+    remote: remote,
+    name: name
+  });
+
+  var result = {
+    debug: JSON.stringify([remote, name])
+  };
+
+  if (tracked_branch) {
+    result.branch = tracked_branch.branch.name;
+
+    if (tracked_branch.review)
+      result.review = format('r/%(id)d "%(summary)s"', tracked_branch.review);
+
+    if (tracked_branch.updating)
+      result.update_ongoing = true;
+
+    if (tracked_branch.disabled) {
+      result.disabled = true;
+    } else if (tracked_branch.pending) {
+      result.update_pending = true;
+    } else if (trigger) {
+      tracked_branch.triggerUpdate();
+      result.update_triggered = true;
+    }
+
+    var log_entry = tracked_branch.getLogEntry(value);
+    if (log_entry) {
+      result.hook_output = log_entry.hookOutput;
+      result.update_successful = log_entry.successful;
+    }
+  }
+
+  return result;
+}
+
 function main(method, path, query) {
   if (method != "POST")
     return;
@@ -59,44 +101,18 @@ function main(method, path, query) {
       });
     }
 
-    var name = data.name;
-    name_transforms.forEach(function (transform) {
-      name = name.replace(transform.regexp, transform.replacement);
-    });
-
-    var tracked_branch = critic.TrackedBranch.find({
-      remote: remote,
-      name: name
-    });
-
-    result = {
-      status: "ok",
-      debug: JSON.stringify([remote, name])
-    };
-
-    if (tracked_branch) {
-      result.branch = tracked_branch.branch.name;
-
-      if (tracked_branch.review)
-	result.review = format('r/%(id)d "%(summary)s"', tracked_branch.review);
-
-      if (tracked_branch.updating)
-	result.update_ongoing = true;
-
-      if (tracked_branch.disabled) {
-	result.disabled = true;
-      } else if (tracked_branch.pending) {
-	result.update_pending = true;
-      } else if (data.trigger) {
-	tracked_branch.triggerUpdate();
-	result.update_triggered = true;
-      }
-
-      var log_entry = tracked_branch.getLogEntry(data.value);
-      if (log_entry) {
-	result.hook_output = log_entry.hookOutput;
-	result.update_successful = log_entry.successful;
-      }
+    if (data.refs) {
+      // Batched form: one entry per pushed ref, results in the same order.
+      result = {
+        status: "ok",
+        results: data.refs.map(function (ref) {
+          return process_ref(remote, ref.name, ref.value, data.trigger);
+        })
+      };
+    } else {
+      // Single-ref form, used when polling for the status of one update.
+      result = process_ref(remote, data.name, data.value, data.trigger);
+      result.status = "ok";
     }
   } catch (error) {
     result = {